@@ -54,6 +54,8 @@ class Base(object):
     getting a list of validation errors and recursively introspecting the schema. All fields should accept a
     `description` argument for use in documentation and introspection.
     """
+    __slots__ = ()
+
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
         """
         Returns a list of errors with the value. An empty return means that it's valid.
@@ -93,6 +95,11 @@ class Constant(Base):
 
     introspect_type = 'constant'
 
+    # Like the Attrs-generated slotted fields, keep supporting weak references
+    __slots__ = (
+        str('values'), str('description'), str('_error_message'), str('_introspect_values'), str('__weakref__'),
+    )
+
     def __init__(self, *args, **kwargs):  # type: (*AnyType, **AnyType) -> None
         self.values = frozenset(args)
         if not self.values:
@@ -112,6 +119,12 @@ class Constant(Base):
         else:
             self._error_message = 'Value is not one of: {}'.format(', '.join(sorted(_repr(v) for v in self.values)))
 
+        # Like the error message, the sorted introspection values are computed once here instead of on every call
+        self._introspect_values = tuple(
+            s if isinstance(s, (six.text_type, bool, int, float, type(None))) else six.text_type(s)
+            for s in sorted(self.values, key=six.text_type)
+        )
+
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
         try:
             is_valid = value in self.values
@@ -126,15 +139,12 @@ class Constant(Base):
     def introspect(self):  # type: () -> Introspection
         return strip_none({
             'type': self.introspect_type,
-            'values': [
-                s if isinstance(s, (six.text_type, bool, int, float, type(None))) else six.text_type(s)
-                for s in sorted(self.values, key=six.text_type)
-            ],
+            'values': list(self._introspect_values),
             'description': self.description,
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Anything(Base):
     """
     Conformity field that allows the value to be literally anything.
@@ -154,7 +164,7 @@ class Anything(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Hashable(Anything):
     """
     Conformity field that ensures that the value is hashable (`hash(...)` can be called on the value without error).
@@ -178,7 +188,7 @@ class Hashable(Anything):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Boolean(Base):
     """
     Conformity field that ensures that the value is a boolean.
@@ -189,7 +199,7 @@ class Boolean(Base):
     description = attr.ib(default=None, validator=attr_is_optional(attr_is_string()))  # type: Optional[six.text_type]
 
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
-        if not isinstance(value, bool):
+        if type(value) is not bool:
             return [
                 Error('Not a boolean'),
             ]
@@ -202,7 +212,7 @@ class Boolean(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Integer(Base):
     """
     Conformity field that ensures that the value is an integer and optionally enforces boundaries for that integer with
@@ -232,7 +242,8 @@ class Integer(Base):
     description = attr.ib(default=None, validator=attr_is_optional(attr_is_string()))  # type: Optional[six.text_type]
 
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
-        if not isinstance(value, self.valid_type) or isinstance(value, bool):
+        # bool cannot be subclassed, so an identity check on the type is equivalent to (and cheaper than) isinstance()
+        if type(value) is bool or not isinstance(value, self.valid_type):
             return [Error('Not {}'.format(self.valid_noun))]
 
         errors = []
@@ -257,7 +268,7 @@ class Integer(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Float(Integer):
     """
     Conformity field that ensures that the value is a float and optionally enforces boundaries for that float with
@@ -269,7 +280,7 @@ class Float(Integer):
     introspect_type = 'float'
 
 
-@attr.s
+@attr.s(slots=True)
 class Decimal(Integer):
     """
     Conformity field that ensures that the value is a `decimal.Decimal` and optionally enforces boundaries for that
@@ -281,7 +292,7 @@ class Decimal(Integer):
     introspect_type = 'decimal'
 
 
-@attr.s
+@attr.s(slots=True)
 class UnicodeString(Base):
     """
     Conformity field that ensures that the value is a unicode string (`str` in Python 3, `unicode` in Python 2) and
@@ -304,11 +315,13 @@ class UnicodeString(Base):
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
         if not isinstance(value, self.valid_type):
             return [Error('Not a {}'.format(self.valid_noun))]
-        elif self.min_length is not None and len(value) < self.min_length:
+
+        length = len(value)
+        if self.min_length is not None and length < self.min_length:
             return [Error('String must have a length of at least {}'.format(self.min_length))]
-        elif self.max_length is not None and len(value) > self.max_length:
+        elif self.max_length is not None and length > self.max_length:
             return [Error('String must have a length no more than {}'.format(self.max_length))]
-        elif not (self.allow_blank or value.strip()):
+        elif not self.allow_blank and (not value or value.isspace()):
             return [Error('String cannot be blank')]
         return []
 
@@ -322,7 +335,7 @@ class UnicodeString(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class ByteString(UnicodeString):
     """
     Conformity field that ensures that the value is a byte string (`bytes` in Python 3, `str` in Python 2) and
@@ -334,7 +347,7 @@ class ByteString(UnicodeString):
     introspect_type = 'bytes'
 
 
-@attr.s
+@attr.s(slots=True)
 class UnicodeDecimal(Base):
     """
     Conformity field that ensures that the value is a unicode string that is also a valid decimal and can successfully
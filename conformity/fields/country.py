@@ -34,6 +34,8 @@ class CountryCodeField(Constant):
 
     introspect_type = 'country_code_field'
 
+    __slots__ = ()
+
     def __init__(
         self,
         code_filter=lambda x: True,  # type: Callable[[AnyStr], bool]
@@ -74,7 +74,7 @@ def _get_errors_for_currency_amount(
     return errors
 
 
-@attr.s
+@attr.s(slots=True)
 class Amount(Base):
     """
     Conformity field that ensures that the value is an instance of `currint.Amount` and optionally enforces boundaries
@@ -227,7 +227,7 @@ class AmountDictionary(AmountRequestDictionary):
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class AmountString(Base):
     """
     Conformity field that ensures that the value is a unicode string matching the format CUR,1234 or CUR:1234, where
@@ -334,6 +334,8 @@ class CurrencyCodeField(Constant):
     """
     introspect_type = 'currency_code_field'
 
+    __slots__ = ()
+
     def __init__(self, code_filter=lambda x: True, **kwargs):
         """
         :param code_filter: If specified, will be called to further filter the available currency codes
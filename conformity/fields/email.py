@@ -84,10 +84,10 @@ class EmailAddress(UnicodeString):
         result = super(EmailAddress, self).errors(value)
         if result:
             return result
-        if not value or '@' not in value:
+        user_part, at_sign, domain_part = value.rpartition('@')
+        if not at_sign:
             return [Error('Not a valid email address (missing @ sign)')]
 
-        user_part, domain_part = value.rsplit('@', 1)
         if not self.user_regex.match(user_part):
             return [Error('Not a valid email address (invalid local user field)', pointer=user_part)]
         if domain_part in self.domain_whitelist or self.is_domain_valid(domain_part):
@@ -8,7 +8,7 @@ import attr
 from conformity.fields.basic import Float
 
 
-@attr.s
+@attr.s(slots=True)
 class Latitude(Float):
     """
     Conformity field that ensures that the value is a float within the normal boundaries of a geographical latitude on
@@ -21,7 +21,7 @@ class Latitude(Float):
         self.lte = min(90, self.lte or 100)
 
 
-@attr.s
+@attr.s(slots=True)
 class Longitude(Float):
     """
     Conformity field that ensures that the value is a float within the normal boundaries of a geographical longitude on
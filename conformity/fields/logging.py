@@ -35,6 +35,8 @@ class PythonLogLevel(fields.Constant):
     documentation.
     """
 
+    __slots__ = ()
+
     def __init__(self, description=None):  # type: (Optional[six.text_type]) -> None
         """
         Constructs a `PythonLogLevel` field.
@@ -54,7 +54,7 @@ from conformity.utils import (
 )
 
 
-@attr.s
+@attr.s(slots=True)
 class Nullable(Base):
     """
     Conformity field that allows a null / `None` value and delegates validation the field type passed as the first
@@ -87,6 +87,8 @@ class Null(Base):
 
     introspect_type = 'null'
 
+    __slots__ = ()
+
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
         if value is not None:
             return [Error('Value is not null')]
@@ -98,7 +100,7 @@ class Null(Base):
         }
 
 
-@attr.s
+@attr.s(slots=True)
 class Polymorph(Base):
     """
     A Conformity field which has one of a set of possible contents based on a field within it (which must be
@@ -159,7 +161,7 @@ class Polymorph(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class ObjectInstance(Base):
     """
     Conformity field that ensures that the value is an instance of the given `valid_type`.
@@ -185,7 +187,7 @@ class ObjectInstance(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class PythonPath(Base):
     """
     Conformity field that accepts only a unicode path to an importable Python type, function, or variable, including
@@ -272,7 +274,7 @@ class PythonPath(Base):
         return thing
 
 
-@attr.s
+@attr.s(slots=True)
 class TypeReference(Base):
     """
     Conformity field that ensures that the value is an instance of `type` and, optionally, that the value is a subclass
@@ -326,6 +328,8 @@ class TypePath(PythonPath):
 
     This is a special convenience `PythonPath` extension for expecting the imported item to be a type.
     """
+    __slots__ = ()
+
     def __init__(
         self,
         base_classes=None,  # type: Optional[Union[Type, TupleType[Type, ...]]]
@@ -420,7 +424,7 @@ class ClassConfigurationSchema(Base):
             self.initiate_cache_for(self.default_path)
 
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
-        if not isinstance(value, Mapping):
+        if type(value) is not dict and not isinstance(value, Mapping):
             return [Error('Not a mapping (dictionary)')]
 
         # check for extra keys (object is allowed in case this gets validated twice)
@@ -443,7 +447,7 @@ class ClassConfigurationSchema(Base):
         if errors:
             return [update_pointer(e, 'path') for e in errors]
 
-        if isinstance(value, MutableMapping):
+        if type(value) is dict or isinstance(value, MutableMapping):
             value['path'] = path  # in case it was defaulted
             if self.add_class_object_to_dict:
                 value['object'] = PythonPath.resolve_python_path(path)
@@ -624,7 +628,7 @@ class All(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class BooleanValidator(Base):
     """
     Conformity field that ensures that the value passes validation with the `typing.Callable[[typing.Any], bool]`
@@ -658,7 +662,7 @@ class BooleanValidator(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class Deprecated(Base):
     field = attr.ib()  # type: Base
     message = attr.ib(
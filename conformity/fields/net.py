@@ -24,7 +24,7 @@ from conformity.types import Error
 ipv4_regex = re.compile(r'^(25[0-5]|2[0-4]\d|[0-1]?\d?\d)(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}$')
 
 
-@attr.s
+@attr.s(slots=True)
 class IPv4Address(UnicodeString):
     """
     Conformity field that ensures that the value is a unicode string that is a valid IPv4 address.
@@ -50,7 +50,7 @@ class IPv4Address(UnicodeString):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class IPv6Address(UnicodeString):
     """
     Conformity field that ensures that the value is a unicode string that is a valid IPv6 address.
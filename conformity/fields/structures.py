@@ -97,7 +97,7 @@ class AdditionalCollectionValidator(Generic[VT]):
         """
 
 
-@attr.s
+@attr.s(slots=True)
 class _BaseSequenceOrSet(Base):
     """
     Conformity field that ensures that the value is a list of items that all pass validation with the Conformity field
@@ -115,6 +115,8 @@ class _BaseSequenceOrSet(Base):
     )  # type: Optional[AdditionalCollectionValidator[AnyType]]
 
     valid_types = None  # type: Union[Type[Sized], TupleType[Type[Sized], ...]]
+    # Concrete types accepted without the (much slower) abstract base class check against `valid_types`
+    concrete_types = ()  # type: TupleType[Type[Sized], ...]
     type_noun = None  # deprecated, will be removed in Conformity 2.0
     introspect_type = None  # type: six.text_type
     type_error = None  # type: six.text_type
@@ -124,15 +126,16 @@ class _BaseSequenceOrSet(Base):
             raise ValueError('min_length cannot be greater than max_length in UnicodeString')
 
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
-        if not isinstance(value, self.valid_types):
+        if type(value) not in self.concrete_types and not isinstance(value, self.valid_types):
             return [Error(self.type_error)]
 
         result = []
-        if self.max_length is not None and len(value) > self.max_length:
+        length = len(value)
+        if self.max_length is not None and length > self.max_length:
             result.append(
                 Error('List is longer than {}'.format(self.max_length)),
             )
-        elif self.min_length is not None and len(value) < self.min_length:
+        elif self.min_length is not None and length < self.min_length:
             result.append(
                 Error('List is shorter than {}'.format(self.min_length)),
             )
@@ -182,7 +185,7 @@ class _BaseSequenceOrSet(Base):
             self.get = lambda: index
 
 
-@attr.s
+@attr.s(slots=True)
 class List(_BaseSequenceOrSet):
     additional_validator = attr.ib(
         default=None,
@@ -190,11 +193,12 @@ class List(_BaseSequenceOrSet):
     )  # type: Optional[AdditionalCollectionValidator[list]]
 
     valid_types = list
+    concrete_types = (list, )
     introspect_type = 'list'
     type_error = 'Not a list'
 
 
-@attr.s
+@attr.s(slots=True)
 class Sequence(_BaseSequenceOrSet):
     additional_validator = attr.ib(
         default=None,
@@ -202,11 +206,12 @@ class Sequence(_BaseSequenceOrSet):
     )  # type: Optional[AdditionalCollectionValidator[SequenceType]]
 
     valid_types = SequenceType
+    concrete_types = (list, tuple)
     introspect_type = 'sequence'
     type_error = 'Not a sequence'
 
 
-@attr.s
+@attr.s(slots=True)
 class Set(_BaseSequenceOrSet):
     """
     Conformity field that ensures that the value is an abstract set of items that all pass validation with the
@@ -219,6 +224,7 @@ class Set(_BaseSequenceOrSet):
     )  # type: Optional[AdditionalCollectionValidator[AbstractSet]]
 
     valid_types = AbstractSet
+    concrete_types = (set, frozenset)
     introspect_type = 'set'
     type_error = 'Not a set or frozenset'
 
@@ -314,15 +320,16 @@ class Dictionary(Base):
                     update_pointer(error, key)
                     for error in (field.errors(value[key]) or [])
                 )
-        # Check for extra keys
-        extra_keys = set(value.keys()) - set(self.contents.keys())
-        if extra_keys and not self.allow_extra_keys:
-            result.append(
-                Error(
-                    'Extra keys present: {}'.format(', '.join(six.text_type(key) for key in sorted(extra_keys))),
-                    code=ERROR_CODE_UNKNOWN,
-                ),
-            )
+        # Check for extra keys (only when they are not allowed, so that permissive schemas skip the scan entirely)
+        if not self.allow_extra_keys:
+            extra_keys = [key for key in value if key not in self.contents]
+            if extra_keys:
+                result.append(
+                    Error(
+                        'Extra keys present: {}'.format(', '.join(six.text_type(key) for key in sorted(extra_keys))),
+                        code=ERROR_CODE_UNKNOWN,
+                    ),
+                )
 
         if not result and self.additional_validator:
             return self.additional_validator.errors(value)
@@ -400,7 +407,7 @@ class Dictionary(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class SchemalessDictionary(Base):
     """
     Conformity field that ensures that the value is a dictionary of any keys and values, but optionally enforcing that
@@ -435,9 +442,10 @@ class SchemalessDictionary(Base):
 
         result = []
 
-        if self.max_length is not None and len(value) > self.max_length:
+        length = len(value)
+        if self.max_length is not None and length > self.max_length:
             result.append(Error('Dict contains more than {} value(s)'.format(self.max_length)))
-        elif self.min_length is not None and len(value) < self.min_length:
+        elif self.min_length is not None and length < self.min_length:
             result.append(Error('Dict contains fewer than {} value(s)'.format(self.min_length)))
 
         for key, field in value.items():
@@ -474,7 +482,8 @@ class SchemalessDictionary(Base):
         return result
 
     def introspect(self):  # type: () -> Introspection
-        result = {
+        # We avoid using isinstance() here as that would also match subclass instances
+        return strip_none({
             'type': self.introspect_type,
             'max_length': self.max_length,
             'min_length': self.min_length,
@@ -482,14 +491,9 @@ class SchemalessDictionary(Base):
             'additional_validation': (
                 self.additional_validator.__class__.__name__ if self.additional_validator else None
             ),
-        }  # type: Introspection
-        # We avoid using isinstance() here as that would also match subclass instances
-        if not self.key_type.__class__ == Hashable:
-            result['key_type'] = self.key_type.introspect()
-        if not self.value_type.__class__ == Anything:
-            result['value_type'] = self.value_type.introspect()
-
-        return strip_none(result)
+            'key_type': None if self.key_type.__class__ == Hashable else self.key_type.introspect(),
+            'value_type': None if self.value_type.__class__ == Anything else self.value_type.introspect(),
+        })
 
 
 class Tuple(Base):
@@ -501,6 +505,9 @@ class Tuple(Base):
 
     introspect_type = 'tuple'
 
+    # Like the Attrs-generated slotted fields, keep supporting weak references
+    __slots__ = (str('contents'), str('description'), str('additional_validator'), str('__weakref__'))
+
     def __init__(self, *contents, **kwargs):  # type: (*Base, **AnyType) -> None
         # We can't use attrs here because we need to capture all positional arguments and support keyword arguments
         self.contents = contents
@@ -4,6 +4,7 @@ from __future__ import (
 )
 
 import datetime
+import sys
 from typing import (
     Any as AnyType,
     FrozenSet,
@@ -30,17 +31,22 @@ from conformity.utils import (
 )
 
 
-try:
-    # noinspection PyUnresolvedReferences
-    from freezegun import api as _freeze
-    valid_datetime_types = frozenset({datetime.datetime, _freeze.FakeDatetime})
-    valid_date_types = frozenset({datetime.date, _freeze.FakeDate})
-except ImportError:
-    valid_datetime_types = frozenset({datetime.datetime})
-    valid_date_types = frozenset({datetime.date})
+valid_datetime_types = frozenset({datetime.datetime})
+valid_date_types = frozenset({datetime.date})
 
 
-@attr.s
+def _is_freezegun_type(value_type, freezegun_type_name):  # type: (Type, Optional[str]) -> bool
+    # Freezegun is far slower to import than all of Conformity, so we never import it ourselves. If it has not already
+    # been imported by someone else, the value cannot possibly be one of its fake types.
+    freezegun_api = sys.modules.get('freezegun.api')
+    return bool(
+        freezegun_type_name and
+        freezegun_api and
+        value_type is getattr(freezegun_api, freezegun_type_name, None)
+    )
+
+
+@attr.s(slots=True)
 class TemporalBase(Base):
     """
     Common base class for all temporal types. Cannot be used on its own without extension.
@@ -51,6 +57,8 @@ class TemporalBase(Base):
     valid_isinstance = None  # type: Optional[Union[Type, TupleType[Type, ...]]]
     valid_noun = None  # type: six.text_type
     valid_types = None  # type: FrozenSet[Type]
+    # Optionally overridden with the name of the matching Freezegun fake type, which is also accepted
+    freezegun_type_name = None  # type: Optional[str]
 
     gt = attr.ib(default=None)  # type: Union[datetime.date, datetime.time, datetime.datetime, datetime.timedelta]
     gte = attr.ib(default=None)  # type: Union[datetime.date, datetime.time, datetime.datetime, datetime.timedelta]
@@ -72,7 +80,7 @@ class TemporalBase(Base):
     def _invalid(cls, value):
         return type(value) not in cls.valid_types and (
             not cls.valid_isinstance or not isinstance(value, cls.valid_isinstance)
-        )
+        ) and not _is_freezegun_type(type(value), cls.freezegun_type_name)
 
     def errors(self, value):  # type: (AnyType) -> ListType[Error]
         if self._invalid(value):
@@ -101,7 +109,7 @@ class TemporalBase(Base):
         })
 
 
-@attr.s
+@attr.s(slots=True)
 class DateTime(TemporalBase):
     """
     Conformity field that ensures that the value is a `datetime.datetime` instance and optionally enforces boundaries
@@ -110,11 +118,12 @@ class DateTime(TemporalBase):
     """
 
     valid_types = valid_datetime_types
+    freezegun_type_name = str('FakeDatetime')
     valid_noun = 'datetime.datetime'
     introspect_type = 'datetime'
 
 
-@attr.s
+@attr.s(slots=True)
 class Date(TemporalBase):
     """
     Conformity field that ensures that the value is a `datetime.date` instance and optionally enforces boundaries
@@ -122,11 +131,12 @@ class Date(TemporalBase):
     """
 
     valid_types = valid_date_types
+    freezegun_type_name = str('FakeDate')
     valid_noun = 'datetime.date'
     introspect_type = 'date'
 
 
-@attr.s
+@attr.s(slots=True)
 class Time(TemporalBase):
     """
     Conformity field that ensures that the value is a `datetime.time` instance and optionally enforces boundaries
@@ -138,7 +148,7 @@ class Time(TemporalBase):
     introspect_type = 'time'
 
 
-@attr.s
+@attr.s(slots=True)
 class TimeDelta(TemporalBase):
     """
     Conformity field that ensures that the value is a `datetime.timedelta` instance and optionally enforces boundaries
@@ -151,7 +161,7 @@ class TimeDelta(TemporalBase):
     introspect_type = 'timedelta'
 
 
-@attr.s
+@attr.s(slots=True)
 class TZInfo(TemporalBase):
     """
     Conformity field that ensures that the value is a `datetime.tzinfo` instance. It has `gt`, `gte`, `lt`, and
@@ -9,6 +9,8 @@ from typing import (
     TypeVar,
 )
 
+import six
+
 from conformity.types import (
     Issue,
     Error,
@@ -40,6 +42,10 @@ def update_pointer(issue, pointer_or_prefix):
     """
     if issue.pointer:
         issue.pointer = '{}.{}'.format(pointer_or_prefix, issue.pointer)
+    elif type(pointer_or_prefix) is six.text_type:
+        issue.pointer = pointer_or_prefix
+    elif type(pointer_or_prefix) is int:
+        issue.pointer = six.text_type(pointer_or_prefix)
     else:
         issue.pointer = '{}'.format(pointer_or_prefix)
     return issue
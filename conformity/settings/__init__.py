@@ -254,14 +254,14 @@ class Settings(Mapping[six.text_type, Any]):
         settings = self._merge_mappings(copy.deepcopy(data), copy.deepcopy(self.defaults))
 
         # Ensure that all keys required by the schema are present in the settings data
-        unpopulated_keys = set(self.schema.keys()) - set(settings.keys())
+        unpopulated_keys = set(self.schema) - set(settings)
         if unpopulated_keys:
             raise self.ImproperlyConfigured(
                 'No value provided for required setting(s): {}'.format(', '.join(unpopulated_keys))
             )
 
         # Ensure that all keys in the settings data are present in the schema
-        unconsumed_keys = set(settings.keys()) - set(self.schema.keys())
+        unconsumed_keys = set(settings) - set(self.schema)
         if unconsumed_keys:
             raise self.ImproperlyConfigured('Unknown setting(s): {}'.format(', '.join(unconsumed_keys)))
 
@@ -279,7 +279,7 @@ class Settings(Mapping[six.text_type, Any]):
     def _merge_mappings(cls, data, defaults):  # type: (SettingsData, SettingsData) -> SettingsData
         new_data = {}  # type: Dict[six.text_type, Any]
 
-        for key in set(itertools.chain(data.keys(), defaults.keys())):
+        for key in set(itertools.chain(data, defaults)):
             if key in data and key in defaults:
                 if isinstance(data[key], Mapping) and isinstance(defaults[key], Mapping):
                     new_data[key] = cls._merge_mappings(data[key], defaults[key])
@@ -28,10 +28,12 @@ isort:skip_file
 """
 
 import collections
+import functools
 import importlib
 import inspect
 import json
 import logging
+import operator
 import os
 import re
 from types import (
@@ -301,7 +303,7 @@ def _pretty_introspect(value: fields.Base, depth: int = 1, nullable: str = '') -
             documentation += '\nNo keys permitted.'
         iterate: Iterable[Tuple[Hashable, fields.Base]] = value.contents.items()
         if not isinstance(value.contents, collections.OrderedDict):
-            iterate = sorted(value.contents.items(), key=lambda i: i[0])
+            iterate = sorted(value.contents.items(), key=operator.itemgetter(0))
         for k, v in iterate:
             documentation += '\n{}- ``{}`` - {}'.format(first, k, _pretty_introspect(v, depth + 1))
         if value.contents or not value.allow_extra_keys:
@@ -384,7 +386,7 @@ def _pretty_introspect(value: fields.Base, depth: int = 1, nullable: str = '') -
             nullable,
             description,
         )
-        for k, v in sorted(value.contents_map.items(), key=lambda i: i[0]):
+        for k, v in sorted(value.contents_map.items(), key=operator.itemgetter(0)):
             documentation += '\n{spaces}- ``{field} == {value}`` - {doc}'.format(
                 spaces=first,
                 field=value.switch_field,
@@ -403,11 +405,14 @@ def _pretty_introspect(value: fields.Base, depth: int = 1, nullable: str = '') -
 
 
 # noinspection PyCompatibility
-def _get_settings_schema_documentation(settings_class_object: Type[Settings]) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def _get_settings_schema_documentation(settings_class_object: Type[Settings]) -> Tuple[str, ...]:
     # moved/adapted from https://github.com/eventbrite/pysoa/blob/e44a3cc/docs/update_reference_docs.py#L518-L548
+    # Settings schemas and defaults are fixed when the class is defined, and Sphinx can emit the docstring event for
+    # the same class many times, so the rendered documentation is cached per class.
     lines = ['**Settings Schema Definition**', '']
 
-    for k, v in sorted(settings_class_object.schema.items(), key=lambda i: i[0]):
+    for k, v in sorted(settings_class_object.schema.items(), key=operator.itemgetter(0)):
         lines.extend('- ``{}`` - {}'.format(k, _pretty_introspect(v)).split('\n'))
 
     lines.append('')
@@ -430,18 +435,19 @@ def _get_settings_schema_documentation(settings_class_object: Type[Settings]) ->
     ).split('\n'):
         lines.append('    {}'.format(line.rstrip()))
 
-    return lines
+    return tuple(lines)
 
 
 # noinspection PyCompatibility
-def _get_class_schema_documentation(class_object: Type) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def _get_class_schema_documentation(class_object: Type) -> Tuple[str, ...]:
     # moved/adapted from https://github.com/eventbrite/pysoa/blob/e44a3cc/docs/update_reference_docs.py#L556-L572
     lines = ['**Class Configuration Schema**', '']
 
     field: fields.Base = getattr(class_object, '_conformity_initialization_schema')
     lines.extend(_pretty_introspect(field, depth=0).split('\n'))
 
-    return lines
+    return tuple(lines)
 
 
 # noinspection PyCompatibility,PyUnusedLocal
@@ -29,6 +29,7 @@ To use this extension, add the following to your Sphinx `conf.py`:
 isort:skip_file
 """
 
+import functools
 import importlib
 import inspect
 import re
@@ -45,6 +46,19 @@ from sphinx.application import Sphinx
 from conformity import __version__
 
 
+# noinspection PyCompatibility
+@functools.lru_cache(maxsize=1)
+def _get_head_commit() -> Optional[str]:  # noqa: E999
+    """
+    Returns the short hash of the current Git commit, or `None` if it cannot be determined. The result is cached so
+    that creating multiple resolvers in a single process forks Git only once.
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('utf-8').strip()
+    except subprocess.CalledProcessError:
+        return None
+
+
 # noinspection PyCompatibility
 def create_linkcode_resolve(
     github_user: str,  # noqa: E999
@@ -63,10 +77,7 @@ def create_linkcode_resolve(
 
     :return: a function that can be assigned to `linkcode_resolve` in your `conf.py` file.
     """
-    try:
-        commit: Optional[str] = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('utf-8').strip()
-    except subprocess.CalledProcessError:
-        commit = None
+    commit = _get_head_commit()
 
     source_re = re.compile(rf'.*((site|dist)-packages|{github_project})/{top_level_module}')
 
@@ -28,7 +28,7 @@ __all__ = (
 )
 
 
-@attr.s
+@attr.s(slots=True)
 class Issue(object):
     """
     Represents an issue found during validation of a value.
@@ -37,7 +37,7 @@ class Issue(object):
     pointer = attr.ib(default=None, validator=attr_is_optional(attr_is_string()))  # type: Optional[six.text_type]
 
 
-@attr.s
+@attr.s(slots=True)
 class Error(Issue):
     """
     Represents an error found during validation of a value.
@@ -45,7 +45,7 @@ class Error(Issue):
     code = attr.ib(default=ERROR_CODE_INVALID, validator=attr_is_string())  # type: six.text_type
 
 
-@attr.s
+@attr.s(slots=True)
 class Warning(Issue):
     """
     Represents a warning found during validation of a value.
@@ -53,7 +53,7 @@ class Warning(Issue):
     code = attr.ib(default=WARNING_CODE_WARNING, validator=attr_is_string())  # type: six.text_type
 
 
-@attr.s
+@attr.s(slots=True)
 class Validation(object):
     errors = attr.ib(factory=list)  # type: List[Error]
     warnings = attr.ib(factory=list)  # type: List[Warning]
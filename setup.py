@@ -38,6 +38,7 @@ tests_require = [
     'mypy~=0.740;python_version>"3.4"',
     'pytest>4.2,<5.4',
     'pytest-cov~=2.5',
+    'pytest-xdist~=1.31',
     'coverage~=5.2',
     'pytest-runner',
     'pytz',
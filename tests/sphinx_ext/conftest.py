@@ -0,0 +1,25 @@
+from __future__ import (
+    absolute_import,
+    unicode_literals,
+)
+
+from typing import cast
+
+import pytest
+from sphinx.application import Sphinx
+
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock  # type: ignore
+
+
+@pytest.fixture
+def sphinx_mock():  # type: () -> Sphinx
+    return cast(Sphinx, mock.MagicMock())
+
+
+@pytest.fixture
+def options_mock():
+    return mock.MagicMock()
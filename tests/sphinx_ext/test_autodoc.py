@@ -18,7 +18,6 @@ from unittest import mock
 import attr
 import pytest
 import six
-from sphinx.application import Sphinx
 from sphinx.config import Config
 
 from conformity import (
@@ -42,6 +41,8 @@ from tests.sphinx_ext.utils import decorated
 
 LocalToThisModuleOptionalInt = Optional[int]
 
+ATTRS_IS_VERSION_17 = attr.__version__.startswith('17.')  # type: ignore
+
 
 class ClassHoldingSigsToTest:
     def sig1(self, one, two=None):  # type: (AnyStr, Optional[bool]) -> None
@@ -185,45 +186,81 @@ class ClassConfigurationToTest:
 @pytest.mark.parametrize(
     ('obj', 'annotations'),
     (
-        (ClassHoldingSigsToTest.sig1, {'one': AnyStr, 'two': Optional[bool], 'return': None}),
-        (ClassHoldingSigsToTest.sig1_35, {'one': AnyStr, 'two': Optional[bool], 'return': None}),
-        (ClassHoldingSigsToTest.sig2, {'one': bool, 'two': Optional[AnyStr], 'args': int, 'return': List[int]}),
-        (ClassHoldingSigsToTest.sig2_35, {'one': bool, 'two': Optional[AnyStr], 'args': int, 'return': List[int]}),
-        (ClassHoldingSigsToTest.sig3, {
-            'one': str,
-            'two': Optional[int],
-            'kwargs': bool,
-            'return': Dict[bytes, int],
-        }),
-        (ClassHoldingSigsToTest.sig3_super_wrapped, {
-            'one': str,
-            'two': Optional[int],
-            'kwargs': bool,
-            'return': Dict[bytes, int],
-        }),
-        (ClassHoldingSigsToTest.sig3_35, {
-            'one': str,
-            'two': Optional[int],
-            'args': AnyType,
-            'kwargs': bool,
-            'return': Dict[bytes, int],
-        }),
-        (ClassHoldingSigsToTest.sig4, {
-            'one': AnyStr,
-            'two': Optional[str],
-            'three': Callable[[AnyStr], bool],
-            'args': str,
-            'kwargs': AnyType,
-            'return': bytes,
-        }),
-        (ClassHoldingSigsToTest.sig4_35, {
-            'one': AnyStr,
-            'two': Optional[str],
-            'three': Callable[[AnyStr], bool],
-            'args': str,
-            'kwargs': AnyType,
-            'return': bytes,
-        }),
+        pytest.param(
+            ClassHoldingSigsToTest.sig1,
+            {'one': AnyStr, 'two': Optional[bool], 'return': None},
+            id='sig1',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig1_35,
+            {'one': AnyStr, 'two': Optional[bool], 'return': None},
+            id='sig1_35',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig2,
+            {'one': bool, 'two': Optional[AnyStr], 'args': int, 'return': List[int]},
+            id='sig2',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig2_35,
+            {'one': bool, 'two': Optional[AnyStr], 'args': int, 'return': List[int]},
+            id='sig2_35',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig3,
+            {
+                'one': str,
+                'two': Optional[int],
+                'kwargs': bool,
+                'return': Dict[bytes, int],
+            },
+            id='sig3',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig3_super_wrapped,
+            {
+                'one': str,
+                'two': Optional[int],
+                'kwargs': bool,
+                'return': Dict[bytes, int],
+            },
+            id='sig3_super_wrapped',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig3_35,
+            {
+                'one': str,
+                'two': Optional[int],
+                'args': AnyType,
+                'kwargs': bool,
+                'return': Dict[bytes, int],
+            },
+            id='sig3_35',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig4,
+            {
+                'one': AnyStr,
+                'two': Optional[str],
+                'three': Callable[[AnyStr], bool],
+                'args': str,
+                'kwargs': AnyType,
+                'return': bytes,
+            },
+            id='sig4',
+        ),
+        pytest.param(
+            ClassHoldingSigsToTest.sig4_35,
+            {
+                'one': AnyStr,
+                'two': Optional[str],
+                'three': Callable[[AnyStr], bool],
+                'args': str,
+                'kwargs': AnyType,
+                'return': bytes,
+            },
+            id='sig4_35',
+        ),
     ),
 )
 def test_get_annotations(obj, annotations):
@@ -231,58 +268,75 @@ def test_get_annotations(obj, annotations):
     assert get_annotations(spec, obj) == annotations
 
 
-@pytest.mark.skipif(
-    attr.__version__.startswith('17.'),  # type: ignore
-    reason='Documentation extensions support only Attrs >= 18',
-)
+@pytest.mark.skipif(ATTRS_IS_VERSION_17, reason='Documentation extensions support only Attrs >= 18')
 @pytest.mark.parametrize(
     ('obj', 'signature', 'return_annotation', 'new_signature', 'new_return_annotation'),
     (
-        (ClassHoldingSigsToTest.sig1, '(one, two=None)', None, '(one: ~AnyStr, two: Optional[bool] = None)', 'None'),
-        (
+        pytest.param(
+            ClassHoldingSigsToTest.sig1,
+            '(one, two=None)',
+            None,
+            '(one: ~AnyStr, two: Optional[bool] = None)',
+            'None',
+            id='sig1',
+        ),
+        pytest.param(
             ClassHoldingSigsToTest.sig1,
             '(one: Fake, two: Faker = None) -> None',
             None,
             '(one: Fake, two: Faker = None)',
             'None',
+            id='sig1-annotated',
         ),
-        (ClassHoldingSigsToTest.sig1_35, '(one, two=None)', None, '(one: ~AnyStr, two: Optional[bool] = None)', 'None'),
-        (
+        pytest.param(
+            ClassHoldingSigsToTest.sig1_35,
+            '(one, two=None)',
+            None,
+            '(one: ~AnyStr, two: Optional[bool] = None)',
+            'None',
+            id='sig1_35',
+        ),
+        pytest.param(
             ClassHoldingSigsToTest.sig2,
             '(one, two=None, *args)',
             None,
             '(one: bool, two: Optional[~AnyStr] = None, *args: int)',
             'List[int]',
+            id='sig2',
         ),
-        (
+        pytest.param(
             ClassHoldingSigsToTest.sig2_35,
             '(one, *args, two=None)',
             None,
             '(one: bool, *args: int, two: Optional[~AnyStr] = None)',
             'List[int]',
+            id='sig2_35',
         ),
-        (
+        pytest.param(
             ClassHoldingSigsToTest.sig3,
             '(one, two=None, **kwargs)',
             'No matter',
             '(one: str, two: Optional[int] = None, **kwargs: bool)',
             'Dict[bytes, int]',
+            id='sig3',
         ),
-        (
+        pytest.param(
             ClassHoldingSigsToTest.sig3_super_wrapped,
             '(one, two=None, **kwargs)',
             'No matter',
             '(one: str, two: Optional[int] = None, **kwargs: bool)',
             'Dict[bytes, int]',
+            id='sig3_super_wrapped',
         ),
-        (
+        pytest.param(
             ClassHoldingSigsToTest.sig3_35,
             '(one, *args, two=None, **kwargs)',
             'None',
             '(one: str, *args: Any, two: Optional[int] = None, **kwargs: bool)',
             'Dict[bytes, int]',
+            id='sig3_35',
         ),
-        (
+        pytest.param(
             ClassHoldingSigsToTest.sig4,
             '(one, two=None, three=lambda x: True, *args, **kwargs)',
             'No matter',
@@ -290,59 +344,63 @@ def test_get_annotations(obj, annotations):
             'three: Callable[[~AnyStr], bool] = <function ClassHoldingSigsToTest.<lambda>>, '
             '*args: str, **kwargs: Any)',
             'bytes',
+            id='sig4',
         ),
-        (
+        pytest.param(
             ClassUsingAttrs27HintsToTest,
             '(one, two=None, three=None)',
             None,
             '(one: str, two: List[int] = NOTHING, three: Union[Dict[str, bool], None] = None)',
             None,
+            id='attrs27-class',
         ),
-        (
+        pytest.param(
             ClassUsingAttrs27HintsToTest.__init__,
             '(one, two=None, three=None)',
             None,
             '(one: str, two: List[int] = NOTHING, three: Union[Dict[str, bool], None] = None)',
             None,
+            id='attrs27-init',
         ),
-        (
+        pytest.param(
             ClassUsingAttrs35HintsToTest,
             '(one, two=None, three=None)',
             None,
             '(one: bytes, two: List[bool] = NOTHING, three: Union[Dict[str, int], None] = None)',
             None,
+            id='attrs35-class',
         ),
-        (
+        pytest.param(
             ClassUsingAttrs35HintsToTest.__init__,
             '(one, two=None, three=None)',
             None,
             '(one: bytes, two: List[bool] = NOTHING, three: Union[Dict[str, int], None] = None)',
             'None',
+            id='attrs35-init',
         ),
     )
 )
-def test_autodoc_process_signature(obj, signature, return_annotation, new_signature, new_return_annotation):
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
-
+def test_autodoc_process_signature(
+    obj,
+    signature,
+    return_annotation,
+    new_signature,
+    new_return_annotation,
+    sphinx_mock,
+    options_mock,
+):
     assert autodoc_process_signature(
-        sphinx, 'method', 'does not matter', obj, options, signature, return_annotation,
+        sphinx_mock, 'method', 'does not matter', obj, options_mock, signature, return_annotation,
     ) == (new_signature, new_return_annotation)
 
 
-def test_autodoc_process_signature_conformity_schema_data():
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
-
+def test_autodoc_process_signature_conformity_schema_data(sphinx_mock, options_mock):
     assert autodoc_process_signature(
-        sphinx, 'data', 'path.to.module.DATA_ATTRIBUTE', PYTHON_LOGGING_CONFIG_SCHEMA, options, None, None,
+        sphinx_mock, 'data', 'path.to.module.DATA_ATTRIBUTE', PYTHON_LOGGING_CONFIG_SCHEMA, options_mock, None, None,
     ) == (' = pre-defined Conformity schema path.to.module.DATA_ATTRIBUTE', None)
 
 
-def test_autodoc_process_docstring_backticks():
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
-
+def test_autodoc_process_docstring_backticks(sphinx_mock, options_mock):
     lines = [
         'This is the first line of `documentation` which should be ``modified`` but `only` if the ',
         'contents ```warrant``` modification. We especially do not `want` to mess ``with`` ',
@@ -355,7 +413,7 @@ def test_autodoc_process_docstring_backticks():
         'isort:skip_file',
     ]
 
-    autodoc_process_docstring(sphinx, 'class', 'does not matter', ClassHoldingSigsToTest, options, lines)
+    autodoc_process_docstring(sphinx_mock, 'class', 'does not matter', ClassHoldingSigsToTest, options_mock, lines)
 
     assert lines == [
         'This is the first line of ``documentation`` which should be ``modified`` but ``only`` if the ',
@@ -370,13 +428,10 @@ def test_autodoc_process_docstring_backticks():
     ]
 
 
-def test_autodoc_process_dostring_conformity_schema_data():
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
-
+def test_autodoc_process_dostring_conformity_schema_data(sphinx_mock, options_mock):
     lines = ['']
 
-    autodoc_process_docstring(sphinx, 'data', 'does not matter', PYTHON_LOGGING_CONFIG_SCHEMA, options, lines)
+    autodoc_process_docstring(sphinx_mock, 'data', 'does not matter', PYTHON_LOGGING_CONFIG_SCHEMA, options_mock, lines)
 
     assert lines[0] == ''
     assert lines[1] == ''
@@ -386,95 +441,106 @@ def test_autodoc_process_dostring_conformity_schema_data():
     )
 
 
-def test_autodoc_process_docstring_settings_class():
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
+_EXPECTED_SETTINGS_LINES = (
+    'This is the original documentation.',
+    '',
+    '',
+    '**Settings Schema Definition**',
+    '',
+    '- ``five`` - any of the types bulleted below: *(no description)*',
+    '',
+    '  - ``integer``: *(no description)*',
+    '  - ``float``: *(no description)*',
+    '',
+    '- ``four`` - ``set`` (nullable): *(no description)*',
+    '',
+    '  **values**',
+    '    ``bytes``: *(no description)*',
+    '',
+    '- ``one`` - strict ``dict``: *(no description)*',
+    '',
+    '  - ``a`` - dictionary with keys ``path`` and ``kwargs`` whose ``kwargs`` schema switches '
+        'based on the value of ``path``, dynamically based on class imported from ``path`` (see the '
+        'configuration settings schema documentation for the class named at ``path``). Nifty schema. '
+        'The imported item at the specified ``path`` must be a subclass of '
+        '``tests.sphinx_ext.test_autodoc.ClassUsingAttrs27HintsToTest``.',
+    '  - ``b`` - a unicode string importable Python path in the format "foo.bar.MyClass", '
+        '"foo.bar:YourClass.CONSTANT", etc. Must be a path, yo. The imported item at the specified '
+        'path must match the following schema:',
+    '',
+    '    **schema**',
+    '      ``unicode``: *(no description)*',
+    '',
+    '  - ``c`` - a Python ``type`` that is a subclass of the following class or classes: '
+        '``tests.sphinx_ext.test_autodoc.ClassHoldingSigsToTest``. Refer to that thing!',
+    '',
+    '- ``seven`` - dictionary whose schema switches based on the value of key ``thing``: '
+        '*(no description)*',
+    '',
+    "  - ``thing == 'thing1'`` - strict ``dict``: *(no description)*",
+    '',
+    '    - ``z`` - ``boolean``: *(no description)*',
+    '',
+    '    Extra keys of any value are allowed.',
+    "  - ``thing == 'thing2'`` - strict ``dict``: *(no description)*",
+    '',
+    '    - ``y`` - ``boolean``: *(no description)*',
+    '',
+    '    Extra keys of any value are allowed. Optional keys: ``y``',
+    '',
+    '',
+    '- ``six`` - a Python object that is an instance of the following class or classes: '
+        '``tests.sphinx_ext.test_autodoc.ClassUsingAttrs27HintsToTest``. Y u no instance?',
+    '- ``three`` - ``list``: *(no description)*',
+    '',
+    '  **values**',
+    '    ``integer``: *(no description)*',
+    '',
+    '- ``two`` - flexible ``dict``: *(no description)*',
+    '',
+    '  **keys**',
+    '    ``unicode``: *(no description)*',
+    '',
+    '  **values**',
+    '    ``boolean``: *(no description)*',
+    '',
+    '',
+    '**Default Values**',
+    '',
+    'Keys present in the dict below can be omitted from compliant settings dicts, in which case '
+        'the values below will apply as the default values.',
+    '',
+    '.. code-block:: json',
+    '',
+)
+
 
+def test_autodoc_process_docstring_settings_class(sphinx_mock, options_mock):
     lines = ['This is the original documentation.']
 
-    autodoc_process_docstring(sphinx, 'class', 'does not matter', SettingsToTest, options, lines)
+    autodoc_process_docstring(sphinx_mock, 'class', 'does not matter', SettingsToTest, options_mock, lines)
 
-    assert lines[0] == 'This is the original documentation.'
-    assert lines[1] == ''
-    assert lines[2] == ''
-    assert lines[3] == '**Settings Schema Definition**'
-    assert lines[4] == ''
-    assert lines[5] == '- ``five`` - any of the types bulleted below: *(no description)*'
-    assert lines[6] == ''
-    assert lines[7] == '  - ``integer``: *(no description)*'
-    assert lines[8] == '  - ``float``: *(no description)*'
-    assert lines[9] == ''
-    assert lines[10] == '- ``four`` - ``set`` (nullable): *(no description)*'
-    assert lines[11] == ''
-    assert lines[12] == '  **values**'
-    assert lines[13] == '    ``bytes``: *(no description)*'
-    assert lines[14] == ''
-    assert lines[15] == '- ``one`` - strict ``dict``: *(no description)*'
-    assert lines[16] == ''
-    assert lines[17] == '  - ``a`` - dictionary with keys ``path`` and ``kwargs`` whose ``kwargs`` schema switches ' \
-                        'based on the value of ``path``, dynamically based on class imported from ``path`` (see the ' \
-                        'configuration settings schema documentation for the class named at ``path``). Nifty schema. ' \
-                        'The imported item at the specified ``path`` must be a subclass of ' \
-                        '``tests.sphinx_ext.test_autodoc.ClassUsingAttrs27HintsToTest``.'
-    assert lines[18] == '  - ``b`` - a unicode string importable Python path in the format "foo.bar.MyClass", ' \
-                        '"foo.bar:YourClass.CONSTANT", etc. Must be a path, yo. The imported item at the specified ' \
-                        'path must match the following schema:'
-    assert lines[19] == ''
-    assert lines[20] == '    **schema**'
-    assert lines[21] == '      ``unicode``: *(no description)*'
-    assert lines[22] == ''
-    assert lines[23] == '  - ``c`` - a Python ``type`` that is a subclass of the following class or classes: ' \
-                        '``tests.sphinx_ext.test_autodoc.ClassHoldingSigsToTest``. Refer to that thing!'
-    assert lines[24] == ''
-    assert lines[25] == '- ``seven`` - dictionary whose schema switches based on the value of key ``thing``: ' \
-                        '*(no description)*'
-    assert lines[26] == ''
-    assert lines[27] == "  - ``thing == 'thing1'`` - strict ``dict``: *(no description)*"
-    assert lines[28] == ''
-    assert lines[29] == '    - ``z`` - ``boolean``: *(no description)*'
-    assert lines[30] == ''
-    assert lines[31] == '    Extra keys of any value are allowed.'
-    assert lines[32] == "  - ``thing == 'thing2'`` - strict ``dict``: *(no description)*"
-    assert lines[33] == ''
-    assert lines[34] == '    - ``y`` - ``boolean``: *(no description)*'
-    assert lines[35] == ''
-    assert lines[36] == '    Extra keys of any value are allowed. Optional keys: ``y``'
-    assert lines[37] == ''
-    assert lines[38] == ''
-    assert lines[39] == '- ``six`` - a Python object that is an instance of the following class or classes: ' \
-                        '``tests.sphinx_ext.test_autodoc.ClassUsingAttrs27HintsToTest``. Y u no instance?'
-    assert lines[40] == '- ``three`` - ``list``: *(no description)*'
-    assert lines[41] == ''
-    assert lines[42] == '  **values**'
-    assert lines[43] == '    ``integer``: *(no description)*'
-    assert lines[44] == ''
-    assert lines[45] == '- ``two`` - flexible ``dict``: *(no description)*'
-    assert lines[46] == ''
-    assert lines[47] == '  **keys**'
-    assert lines[48] == '    ``unicode``: *(no description)*'
-    assert lines[49] == ''
-    assert lines[50] == '  **values**'
-    assert lines[51] == '    ``boolean``: *(no description)*'
-    assert lines[52] == ''
-    assert lines[53] == ''
-    assert lines[54] == '**Default Values**'
-    assert lines[55] == ''
-    assert lines[56] == 'Keys present in the dict below can be omitted from compliant settings dicts, in which case ' \
-                        'the values below will apply as the default values.'
-    assert lines[57] == ''
-    assert lines[58] == '.. code-block:: json'
-    assert lines[59] == ''
-
-    assert json.loads('\n'.join(lines[59:]).strip()) == SettingsToTest.defaults
-
-
-def test_autodoc_process_docstring_class_configuration():
-    sphinx = cast(Sphinx, mock.MagicMock())
-    options = mock.MagicMock()
+    assert lines[:len(_EXPECTED_SETTINGS_LINES)] == list(_EXPECTED_SETTINGS_LINES)
 
+    assert json.loads('\n'.join(lines[len(_EXPECTED_SETTINGS_LINES):]).strip()) == SettingsToTest.defaults
+
+
+def test_autodoc_process_docstring_settings_class_cached(sphinx_mock, options_mock):
+    first_lines = ['This is the original documentation.']
+    autodoc_process_docstring(sphinx_mock, 'class', 'does not matter', SettingsToTest, options_mock, first_lines)
+
+    second_lines = ['This is the original documentation.']
+    with mock.patch('conformity.sphinx_ext.autodoc._pretty_introspect') as mock_pretty_introspect:
+        autodoc_process_docstring(sphinx_mock, 'class', 'does not matter', SettingsToTest, options_mock, second_lines)
+
+    assert mock_pretty_introspect.call_count == 0
+    assert second_lines == first_lines
+
+
+def test_autodoc_process_docstring_class_configuration(sphinx_mock, options_mock):
     lines = ['This is the original documentation.']
 
-    autodoc_process_docstring(sphinx, 'class', 'does not matter', ClassConfigurationToTest, options, lines)
+    autodoc_process_docstring(sphinx_mock, 'class', 'does not matter', ClassConfigurationToTest, options_mock, lines)
 
     assert lines[0] == 'This is the original documentation.'
     assert lines[1] == ''
@@ -488,25 +554,22 @@ def test_autodoc_process_docstring_class_configuration():
     assert lines[9] == '- ``three`` - ``decimal``: *(no description)*'
 
 
-def test_config_initialized():
-    sphinx = mock.MagicMock()
+def test_config_initialized(sphinx_mock):
     config = mock.MagicMock()
     config.html_static_path = ['foo/bar/_static']
 
-    config_initialized(cast(Sphinx, sphinx), cast(Config, config))
+    config_initialized(sphinx_mock, cast(Config, config))
 
     assert len(config.html_static_path) == 2
     assert config.html_static_path[-1].endswith('conformity/sphinx_ext/static')
 
-    sphinx.add_js_file.assert_called_once_with('autodoc_auto_toc.js')
-
+    sphinx_mock.add_js_file.assert_called_once_with('autodoc_auto_toc.js')
 
-def test_setup():
-    sphinx = mock.MagicMock()
 
-    assert setup_extension_for_test(cast(Sphinx, sphinx)) == {'version': __version__, 'parallel_read_safe': True}
+def test_setup(sphinx_mock):
+    assert setup_extension_for_test(sphinx_mock) == {'version': __version__, 'parallel_read_safe': True}
 
-    sphinx.connect.assert_has_calls(
+    sphinx_mock.connect.assert_has_calls(
         [
             mock.call('autodoc-process-docstring', autodoc_process_docstring),
             mock.call('autodoc-process-signature', autodoc_process_signature),
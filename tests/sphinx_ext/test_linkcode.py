@@ -1,19 +1,27 @@
 """isort:skip_file"""
 import subprocess
-from typing import cast
 # noinspection PyCompatibility
 from unittest import mock
 
 import pytest
-from sphinx.application import Sphinx
 
 from conformity import __version__
 from conformity.sphinx_ext.linkcode import (
+    _get_head_commit,
     create_linkcode_resolve,
     setup as setup_extension_for_test,  # aliased because PyTest will try to run something called `setup`
 )
 
 
+@pytest.fixture
+def clear_head_commit_cache():
+    # Keep the commit from one test's mocked `git rev-parse` from leaking into other tests
+    _get_head_commit.cache_clear()
+    yield
+    _get_head_commit.cache_clear()
+
+
+@pytest.mark.usefixtures('clear_head_commit_cache')
 @pytest.mark.parametrize(
     ('user', 'project', 'module', 'tag', 'commit', 'info', 'link'),
     (
@@ -51,9 +59,17 @@ def test_create_linkcode_resolve(user, project, module, tag, commit, info, link)
     assert '#L1-L' not in result
 
 
-def test_setup():
-    sphinx = mock.MagicMock()
+@pytest.mark.usefixtures('clear_head_commit_cache')
+def test_create_linkcode_resolve_caches_commit():
+    with mock.patch('conformity.sphinx_ext.linkcode.subprocess.check_output') as mock_check_output:
+        mock_check_output.return_value = b'8ot873t'
+        create_linkcode_resolve('eventbrite', 'conformity', 'conformity', '1.2.3')
+        create_linkcode_resolve('eventbrite', 'conformity', 'conformity', '1.2.3')
+
+    mock_check_output.assert_called_once_with(['git', 'rev-parse', '--short', 'HEAD'])
+
 
-    assert setup_extension_for_test(cast(Sphinx, sphinx)) == {'version': __version__, 'parallel_read_safe': True}
+def test_setup(sphinx_mock):
+    assert setup_extension_for_test(sphinx_mock) == {'version': __version__, 'parallel_read_safe': True}
 
-    assert sphinx.connect.call_count == 0
+    assert sphinx_mock.connect.call_count == 0
@@ -9,15 +9,17 @@ import decimal
 from typing import (
     AbstractSet,
     Any as AnyType,
+    Generator,
     Hashable as HashableType,
+    List as ListType,
     Mapping,
     Sequence as SequenceType,
     Tuple as TupleType,
 )
 import unittest
 import warnings
+import weakref
 
-import freezegun
 import pytest
 import pytz
 import six
@@ -37,6 +39,7 @@ from conformity.fields import (
     DateTime,
     Decimal,
     Dictionary,
+    EmailAddress,
     Float,
     Hashable,
     Integer,
@@ -59,72 +62,37 @@ except ImportError:
     import mock  # type: ignore
 
 
+# Child introspections that test_dictionary_ordering expects to find in the contents of the extended schemas
+_UNICODE_INTROSPECTION = UnicodeString().introspect()
+_BOOLEAN_INTROSPECTION = Boolean().introspect()
+_INTEGER_INTROSPECTION = Integer().introspect()
+_INTEGER_LIST_INTROSPECTION = List(Integer()).introspect()
+_UNICODE_SET_INTROSPECTION = Set(UnicodeString()).introspect()
+_DECIMAL_UNICODE_TUPLE_INTROSPECTION = Tuple(Decimal(), UnicodeString()).introspect()
+
+
 class FieldTests(unittest.TestCase):
     """
     Tests fields
     """
-    def test_integers(self):  # type: () -> None
-        schema = Integer(gt=0, lt=10)
-        self.assertEqual([], schema.errors(1))
-        self.assertEqual([Error('Not an integer')], schema.errors('one'))
-        self.assertEqual([Error('Not an integer')], schema.errors(True))
-        self.assertEqual([Error('Value not > 0')], schema.errors(0))
-        self.assertEqual([Error('Value not < 10')], schema.errors(10))
-
-        schema = Integer(gte=0, lte=10)
-        self.assertEqual([Error('Value not >= 0')], schema.errors(-1))
-        self.assertEqual([Error('Value not <= 10')], schema.errors(11))
-
-    def test_strings(self):  # type: () -> None
-        schema = UnicodeString()
-        self.assertEqual([], schema.errors(''))
-        self.assertEqual([], schema.errors('Foo bar baz qux foo bar baz qux foo bar baz qux foo bar baz qux foo bar'))
-        self.assertEqual([Error('Not a unicode string')], schema.errors(b'Test'))
-
-        schema = UnicodeString(min_length=5, max_length=10)
-        self.assertEqual([Error('String must have a length of at least 5')], schema.errors(''))
-        self.assertEqual([Error('String must have a length of at least 5')], schema.errors('1234'))
-        self.assertEqual([], schema.errors('12345'))
-        self.assertEqual([], schema.errors('1234567890'))
-        self.assertEqual([Error('String must have a length no more than 10')], schema.errors('12345678901'))
-
-        schema = UnicodeString(allow_blank=False)
-        self.assertEqual([Error('String cannot be blank')], schema.errors(''))
-        self.assertEqual([Error('String cannot be blank')], schema.errors(' '))
-        self.assertEqual([Error('String cannot be blank')], schema.errors(' \n '))
-        self.assertEqual([], schema.errors('foo'))
-
-        schema = ByteString()
-        self.assertEqual([], schema.errors(b''))
-        self.assertEqual([], schema.errors(b'Foo bar baz qux foo bar baz qux foo bar baz qux foo bar baz qux foo'))
-        self.assertEqual([Error('Not a byte string')], schema.errors('Test'))
-
-        schema = ByteString(min_length=5, max_length=10)
-        self.assertEqual([Error('String must have a length of at least 5')], schema.errors(b''))
-        self.assertEqual([Error('String must have a length of at least 5')], schema.errors(b'1234'))
-        self.assertEqual([], schema.errors(b'12345'))
-        self.assertEqual([], schema.errors(b'1234567890'))
-        self.assertEqual([Error('String must have a length no more than 10')], schema.errors(b'12345678901'))
-
-        with pytest.raises(ValueError):
-            UnicodeString(min_length=6, max_length=5)
-
     def test_complex(self):  # type: () -> None
+        # Fields hold no per-value state, so a single instance can be shared by every key it validates
+        unicode_string = UnicodeString()
 
         schema = Dictionary({
             'child_ids': List(Integer(gt=0)),
             'address': Dictionary(
                 {
-                    'line1': UnicodeString(),
-                    'line2': UnicodeString(),
-                    'city': UnicodeString(),
-                    'postcode': UnicodeString(),
-                    'state': UnicodeString(),
-                    'country': UnicodeString(),
+                    'line1': unicode_string,
+                    'line2': unicode_string,
+                    'city': unicode_string,
+                    'postcode': unicode_string,
+                    'state': unicode_string,
+                    'country': unicode_string,
                 },
                 optional_keys=('line2', 'state'),
             ),
-            'unique_things': Set(UnicodeString()),
+            'unique_things': Set(unicode_string),
         })
 
         self.assertEqual(
@@ -132,21 +100,22 @@ class FieldTests(unittest.TestCase):
             [Error('Not a dict')],
         )
 
-        self.assertEqual(
-            sorted(schema.errors(
+        six.assertCountEqual(
+            self,
+            schema.errors(
                 {
                     'child_ids': [1, 2, 'ten'],
                     'unsolicited_item': 'Should not be here',
                     'another_bad': 'Also extra',
                     'unique_things': ['hello', 'world'],
                 },
-            )),
-            sorted([
+            ),
+            [
                 Error('Not an integer', pointer='child_ids.2'),
                 Error('Missing key: address', code=ERROR_CODE_MISSING, pointer='address'),
                 Error('Extra keys present: another_bad, unsolicited_item', code=ERROR_CODE_UNKNOWN),
                 Error('Not a set or frozenset', pointer='unique_things'),
-            ]),
+            ],
         )
 
         self.assertEqual(
@@ -244,6 +213,9 @@ class FieldTests(unittest.TestCase):
             replace_optional_keys=True,
         )
 
+        introspection2 = schema2.introspect()
+        introspection3 = schema3.introspect()
+
         self.assertEqual(
             Dictionary(
                 {
@@ -255,7 +227,7 @@ class FieldTests(unittest.TestCase):
                 allow_extra_keys=False,
                 description='Hello, world',
             ).introspect(),
-            schema2.introspect(),
+            introspection2,
         )
 
         self.assertEqual(
@@ -269,12 +241,12 @@ class FieldTests(unittest.TestCase):
                 allow_extra_keys=True,
                 description='Goodbye, universe',
             ).introspect(),
-            schema3.introspect(),
+            introspection3,
         )
 
-        assert 'display_order' not in schema1.introspect()
-        assert 'display_order' not in schema2.introspect()
-        assert 'display_order' not in schema3.introspect()
+        self.assertNotIn('display_order', schema1.introspect())
+        self.assertNotIn('display_order', introspection2)
+        self.assertNotIn('display_order', introspection3)
 
     def test_dictionary_ordering(self):  # type: () -> None
         schema1 = Dictionary(
@@ -287,13 +259,14 @@ class FieldTests(unittest.TestCase):
             description='Hello, world',
         )
 
-        assert schema1.introspect()['contents'] == {
-            'baz': List(Integer()).introspect(),
-            'foo': UnicodeString().introspect(),
-            'bar': Boolean().introspect(),
+        introspection1 = schema1.introspect()
+        assert introspection1['contents'] == {
+            'baz': _INTEGER_LIST_INTROSPECTION,
+            'foo': _UNICODE_INTROSPECTION,
+            'bar': _BOOLEAN_INTROSPECTION,
         }
 
-        assert schema1.introspect()['display_order'] == ['foo', 'bar', 'baz']
+        assert introspection1['display_order'] == ['foo', 'bar', 'baz']
 
         schema2 = schema1.extend(OrderedDict((
             ('bar', Integer()),
@@ -301,15 +274,16 @@ class FieldTests(unittest.TestCase):
             ('moon', Tuple(Decimal(), UnicodeString())),
         )))
 
-        assert schema2.introspect()['contents'] == {
-            'baz': List(Integer()).introspect(),
-            'foo': UnicodeString().introspect(),
-            'moon': Tuple(Decimal(), UnicodeString()).introspect(),
-            'bar': Integer().introspect(),
-            'qux': Set(UnicodeString()).introspect(),
+        introspection2 = schema2.introspect()
+        assert introspection2['contents'] == {
+            'baz': _INTEGER_LIST_INTROSPECTION,
+            'foo': _UNICODE_INTROSPECTION,
+            'moon': _DECIMAL_UNICODE_TUPLE_INTROSPECTION,
+            'bar': _INTEGER_INTROSPECTION,
+            'qux': _UNICODE_SET_INTROSPECTION,
         }
 
-        assert schema2.introspect()['display_order'] == ['foo', 'bar', 'baz', 'qux', 'moon']
+        assert introspection2['display_order'] == ['foo', 'bar', 'baz', 'qux', 'moon']
 
         assert not schema1.errors({'bar': True, 'foo': 'Hello', 'baz': [15]})
 
@@ -363,9 +337,6 @@ class FieldTests(unittest.TestCase):
             [],
         )
 
-        with freezegun.freeze_time():
-            self.assertEqual([], datetime_schema.errors(datetime.datetime.now()))
-
         # date is not a valid datetime
         self.assertEqual(
             datetime_schema.errors(datetime.date.today()),
@@ -396,15 +367,6 @@ class FieldTests(unittest.TestCase):
             [Error('Not a datetime.date instance')],
         )
 
-        with freezegun.freeze_time():
-            self.assertEqual([], date_schema.errors(datetime.date.today()))
-
-            # fake datetime is not a valid date
-            self.assertEqual(
-                [Error('Not a datetime.date instance')],
-                date_schema.errors(datetime.datetime.now()),
-            )
-
         self.assertEqual(
             date_schema.errors(past1955.date()),
             [Error('Value not > 1985-10-26')],
@@ -682,46 +644,6 @@ class FieldTests(unittest.TestCase):
         d = ExtraExtraDict()
         assert d.optional_keys == frozenset({})
 
-    def test_decimal(self):  # type: () -> None
-        """
-        Tests decimal.Decimal object validation
-        """
-        self.assertEqual([], Decimal().errors(decimal.Decimal('1')))
-        self.assertEqual([], Decimal().errors(decimal.Decimal('1.4')))
-        self.assertEqual([], Decimal().errors(decimal.Decimal('-3.14159')))
-        self.assertEqual(
-            [Error('Not a decimal')],
-            Decimal().errors('-3.14159')
-        )
-        self.assertEqual(
-            [Error('Not a decimal')],
-            Decimal().errors(-3.14159)
-        )
-        self.assertEqual(
-            [Error('Not a decimal')],
-            Decimal().errors(15)
-        )
-        self.assertEqual(
-            [Error('Value not > 6')],
-            Decimal(lt=12, gt=6).errors(decimal.Decimal('6')),
-        )
-        self.assertEqual(
-            [Error('Value not < 12')],
-            Decimal(lt=12, gt=6).errors(decimal.Decimal('12')),
-        )
-        self.assertEqual([], Decimal(lt=12, gt=6).errors(decimal.Decimal('6.1')))
-        self.assertEqual([], Decimal(lt=12, gt=6).errors(decimal.Decimal('11.9')))
-        self.assertEqual(
-            [Error('Value not >= 6')],
-            Decimal(lte=12, gte=6).errors(decimal.Decimal('5.9')),
-        )
-        self.assertEqual(
-            [Error('Value not <= 12')],
-            Decimal(lte=12, gte=6).errors(decimal.Decimal('12.1')),
-        )
-        self.assertEqual([], Decimal(lte=12, gte=6).errors(decimal.Decimal('6')))
-        self.assertEqual([], Decimal(lte=12, gte=6).errors(decimal.Decimal('12')))
-
     def test_unicode_decimal(self):  # type: () -> None
         """
         Tests unicode decimal parsing
@@ -757,37 +679,6 @@ class FieldTests(unittest.TestCase):
             'description': 'Foo description',
         }
 
-    def test_multi_constant(self):  # type: () -> None
-        """
-        Tests constants with multiple options
-        """
-        schema = Constant(42, 36, 81, 9231)
-        self.assertEqual(
-            schema.errors(9231),
-            [],
-        )
-        self.assertEqual(
-            schema.errors(81),
-            [],
-        )
-        self.assertEqual(
-            schema.errors(360000),
-            [Error('Value is not one of: 36, 42, 81, 9231', code=ERROR_CODE_UNKNOWN)],
-        )
-        self.assertEqual(
-            schema.errors([42]),
-            [Error('Value is not one of: 36, 42, 81, 9231', code=ERROR_CODE_UNKNOWN)],
-        )
-
-        with pytest.raises(TypeError):
-            Constant(42, 36, 81, 9231, description='foo', unsupported='bar')
-
-        with pytest.raises(ValueError):
-            Constant()
-
-        with pytest.raises(TypeError):
-            Constant(42, 36, 81, 9231, description=b'not unicode')
-
     def test_base(self):  # type: () -> None
         schema = Base()
         assert schema.errors('foo') == [Error('Validation not implemented on base type')]
@@ -811,6 +702,208 @@ class FieldTests(unittest.TestCase):
         mock_warnings.assert_called_once_with(mock_value)
         assert validation.warnings == mock_warnings.return_value
 
+    def test_introspection_is_not_shared(self):  # type: () -> None
+        schema = Integer(gt=1, description='A number')
+
+        introspection = schema.introspect()
+        assert introspection == {'type': 'integer', 'gt': 1, 'description': 'A number'}
+
+        introspection['deprecated'] = True
+        assert schema.introspect() == {'type': 'integer', 'gt': 1, 'description': 'A number'}
+
+        schema.lt = 12
+        assert schema.introspect() == {'type': 'integer', 'gt': 1, 'lt': 12, 'description': 'A number'}
+
+        constant = Constant('a', 'b')
+        introspection = constant.introspect()
+        introspection['values'].append('c')
+        assert constant.introspect() == {'type': 'constant', 'values': ['a', 'b']}
+
+        email = EmailAddress(whitelist=['green.org'])
+        introspection = email.introspect()
+        introspection['domain_whitelist'].append('blue.org')
+        assert email.introspect() == {'type': 'email_address', 'domain_whitelist': ['green.org']}
+
+        email.domain_whitelist = {'blue.org'}
+        assert email.introspect() == {'type': 'email_address', 'domain_whitelist': ['blue.org']}
+
+    def test_slotted_fields_have_no_instance_dict(self):  # type: () -> None
+        for schema in (
+            Constant(1), Boolean(), Integer(), Float(), UnicodeString(), DateTime(), TimeDelta(),
+            List(Integer()), Set(Integer()), SchemalessDictionary(), Tuple(Integer(), Boolean()),
+        ):
+            assert not hasattr(schema, '__dict__'), schema
+
+        assert not hasattr(Error('Not an integer', pointer='foo'), '__dict__')
+
+        # Slotted fields still support weak references
+        for schema in (Constant(1), Integer(), UnicodeString(), DateTime(), List(Integer()), Tuple(Integer())):
+            assert weakref.ref(schema)() is schema
+
+        class CustomString(UnicodeString):
+            pass
+
+        # Subclasses that do not declare slots can still set arbitrary attributes
+        schema = CustomString()
+        schema.foo = 'bar'  # type: ignore
+        assert schema.introspect() == {'type': 'unicode'}
+
+
+@pytest.mark.parametrize(('schema', 'value', 'expected_errors'), (
+    pytest.param(Integer(gt=0, lt=10), 1, [], id='exclusive-valid'),
+    pytest.param(Integer(gt=0, lt=10), 'one', [Error('Not an integer')], id='exclusive-string'),
+    pytest.param(Integer(gt=0, lt=10), True, [Error('Not an integer')], id='exclusive-bool'),
+    pytest.param(Integer(gt=0, lt=10), 0, [Error('Value not > 0')], id='exclusive-too-small'),
+    pytest.param(Integer(gt=0, lt=10), 10, [Error('Value not < 10')], id='exclusive-too-large'),
+    pytest.param(Integer(gte=0, lte=10), -1, [Error('Value not >= 0')], id='inclusive-too-small'),
+    pytest.param(Integer(gte=0, lte=10), 11, [Error('Value not <= 10')], id='inclusive-too-large'),
+))
+def test_integers(schema, value, expected_errors):  # type: (Base, AnyType, ListType[Error]) -> None
+    assert schema.errors(value) == expected_errors
+
+
+@pytest.mark.parametrize(('schema', 'value', 'expected_errors'), (
+    pytest.param(UnicodeString(), '', [], id='unicode-empty'),
+    pytest.param(
+        UnicodeString(),
+        'Foo bar baz qux foo bar baz qux foo bar baz qux foo bar baz qux foo bar',
+        [],
+        id='unicode-long',
+    ),
+    pytest.param(UnicodeString(), b'Test', [Error('Not a unicode string')], id='unicode-bytes'),
+    pytest.param(
+        UnicodeString(min_length=5, max_length=10),
+        '',
+        [Error('String must have a length of at least 5')],
+        id='unicode-bounded-empty',
+    ),
+    pytest.param(
+        UnicodeString(min_length=5, max_length=10),
+        '1234',
+        [Error('String must have a length of at least 5')],
+        id='unicode-bounded-too-short',
+    ),
+    pytest.param(UnicodeString(min_length=5, max_length=10), '12345', [], id='unicode-bounded-min'),
+    pytest.param(UnicodeString(min_length=5, max_length=10), '1234567890', [], id='unicode-bounded-max'),
+    pytest.param(
+        UnicodeString(min_length=5, max_length=10),
+        '12345678901',
+        [Error('String must have a length no more than 10')],
+        id='unicode-bounded-too-long',
+    ),
+    pytest.param(UnicodeString(allow_blank=False), '', [Error('String cannot be blank')], id='unicode-blank-empty'),
+    pytest.param(UnicodeString(allow_blank=False), ' ', [Error('String cannot be blank')], id='unicode-blank-space'),
+    pytest.param(
+        UnicodeString(allow_blank=False),
+        ' \n ',
+        [Error('String cannot be blank')],
+        id='unicode-blank-whitespace',
+    ),
+    pytest.param(UnicodeString(allow_blank=False), 'foo', [], id='unicode-not-blank'),
+    pytest.param(UnicodeString(allow_blank=False), ' foo ', [], id='unicode-not-blank-padded'),
+    pytest.param(ByteString(), b'', [], id='bytes-empty'),
+    pytest.param(
+        ByteString(),
+        b'Foo bar baz qux foo bar baz qux foo bar baz qux foo bar baz qux foo',
+        [],
+        id='bytes-long',
+    ),
+    pytest.param(ByteString(), 'Test', [Error('Not a byte string')], id='bytes-unicode'),
+    pytest.param(
+        ByteString(min_length=5, max_length=10),
+        b'',
+        [Error('String must have a length of at least 5')],
+        id='bytes-bounded-empty',
+    ),
+    pytest.param(
+        ByteString(min_length=5, max_length=10),
+        b'1234',
+        [Error('String must have a length of at least 5')],
+        id='bytes-bounded-too-short',
+    ),
+    pytest.param(ByteString(min_length=5, max_length=10), b'12345', [], id='bytes-bounded-min'),
+    pytest.param(ByteString(min_length=5, max_length=10), b'1234567890', [], id='bytes-bounded-max'),
+    pytest.param(
+        ByteString(min_length=5, max_length=10),
+        b'12345678901',
+        [Error('String must have a length no more than 10')],
+        id='bytes-bounded-too-long',
+    ),
+))
+def test_strings(schema, value, expected_errors):  # type: (Base, AnyType, ListType[Error]) -> None
+    assert schema.errors(value) == expected_errors
+
+
+def test_strings_invalid_lengths():  # type: () -> None
+    with pytest.raises(ValueError):
+        UnicodeString(min_length=6, max_length=5)
+
+
+@pytest.mark.parametrize(('schema', 'value', 'expected_errors'), (
+    pytest.param(Decimal(), decimal.Decimal('1'), [], id='integral'),
+    pytest.param(Decimal(), decimal.Decimal('1.4'), [], id='fractional'),
+    pytest.param(Decimal(), decimal.Decimal('-3.14159'), [], id='negative'),
+    pytest.param(Decimal(), '-3.14159', [Error('Not a decimal')], id='string'),
+    pytest.param(Decimal(), -3.14159, [Error('Not a decimal')], id='float'),
+    pytest.param(Decimal(), 15, [Error('Not a decimal')], id='int'),
+    pytest.param(Decimal(lt=12, gt=6), decimal.Decimal('6'), [Error('Value not > 6')], id='exclusive-at-min'),
+    pytest.param(Decimal(lt=12, gt=6), decimal.Decimal('12'), [Error('Value not < 12')], id='exclusive-at-max'),
+    pytest.param(Decimal(lt=12, gt=6), decimal.Decimal('6.1'), [], id='exclusive-above-min'),
+    pytest.param(Decimal(lt=12, gt=6), decimal.Decimal('11.9'), [], id='exclusive-below-max'),
+    pytest.param(Decimal(lte=12, gte=6), decimal.Decimal('5.9'), [Error('Value not >= 6')], id='inclusive-too-small'),
+    pytest.param(Decimal(lte=12, gte=6), decimal.Decimal('12.1'), [Error('Value not <= 12')], id='inclusive-too-large'),
+    pytest.param(Decimal(lte=12, gte=6), decimal.Decimal('6'), [], id='inclusive-at-min'),
+    pytest.param(Decimal(lte=12, gte=6), decimal.Decimal('12'), [], id='inclusive-at-max'),
+))
+def test_decimal(schema, value, expected_errors):  # type: (Base, AnyType, ListType[Error]) -> None
+    """
+    Tests decimal.Decimal object validation
+    """
+    assert schema.errors(value) == expected_errors
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    (9231, []),
+    (81, []),
+    (360000, [Error('Value is not one of: 36, 42, 81, 9231', code=ERROR_CODE_UNKNOWN)]),
+    ([42], [Error('Value is not one of: 36, 42, 81, 9231', code=ERROR_CODE_UNKNOWN)]),
+))
+def test_multi_constant(value, expected_errors):  # type: (AnyType, ListType[Error]) -> None
+    """
+    Tests constants with multiple options
+    """
+    assert Constant(42, 36, 81, 9231).errors(value) == expected_errors
+
+
+def test_multi_constant_invalid_arguments():  # type: () -> None
+    with pytest.raises(TypeError):
+        Constant(42, 36, 81, 9231, description='foo', unsupported='bar')
+
+    with pytest.raises(ValueError):
+        Constant()
+
+    with pytest.raises(TypeError):
+        Constant(42, 36, 81, 9231, description=b'not unicode')
+
+
+@pytest.fixture
+def frozen_time():  # type: () -> Generator[AnyType, None, None]
+    # Freezegun takes longer to import than the rest of this module combined, so only import it when it is needed
+    import freezegun
+
+    with freezegun.freeze_time() as frozen:
+        yield frozen
+
+
+def test_temporal_frozen_time(frozen_time):  # type: (AnyType) -> None
+    past1985 = datetime.datetime(1985, 10, 26, 1, 21, 0)
+
+    assert DateTime(gt=past1985).errors(datetime.datetime.now()) == []
+    assert Date(gt=past1985.date()).errors(datetime.date.today()) == []
+
+    # fake datetime is not a valid date
+    assert Date(gt=past1985.date()).errors(datetime.datetime.now()) == [Error('Not a datetime.date instance')]
+
 
 @pytest.mark.parametrize(('kwarg', ), (('gt', ), ('lt', ), ('gte', ), ('lte', )))
 def test_tzinfo_deprecated_arguments(kwarg):
@@ -827,6 +920,18 @@ def test_tzinfo_deprecated_arguments(kwarg):
     ) in str(w[-1].message)
 
 
+class _ItemsNotSequence(object):
+    def __getitem__(self, index):
+        return ('hello', 'goodbye')[index]
+
+    def __len__(self):
+        return 2
+
+
+class _ItemsSequence(_ItemsNotSequence, six.moves.collections_abc.Sequence):  # type: ignore
+    pass
+
+
 class TestStructures(object):
     def test_additional_collection_validator(self):
         class V(AdditionalCollectionValidator[list]):
@@ -894,6 +999,23 @@ class TestStructures(object):
         assert field.errors([500, 499]) == []
         assert field.errors((500, 499)) == []
 
+    def test_sequence_concrete_types_and_abc_fallback(self):  # type: () -> None
+        field = Sequence(UnicodeString())
+
+        # Lists and tuples take the concrete-type fast path
+        assert field.errors(['hello']) == []
+        assert field.errors(('hello', 'goodbye')) == []
+
+        # Anything else must pass the abstract base class check
+        assert field.errors(_ItemsSequence()) == []
+        assert field.errors(_ItemsNotSequence()) == [Error(message='Not a sequence')]
+        assert field.errors('hello') == []
+
+        # A mock pretending to be a list passes, but must not make every other mock pass
+        field = List(UnicodeString())
+        assert field.errors(mock.MagicMock(spec=list)) == []
+        assert field.errors(mock.MagicMock()) == [Error(message='Not a list')]
+
     def test_set(self):  # type: () -> None
         with pytest.raises(TypeError):
             # noinspection PyTypeChecker
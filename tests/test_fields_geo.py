@@ -3,7 +3,7 @@ from __future__ import (
     unicode_literals,
 )
 
-import unittest
+import pytest
 
 from conformity.types import Error
 from conformity.fields import (
@@ -12,52 +12,38 @@ from conformity.fields import (
 )
 
 
-class GeoFieldTests(unittest.TestCase):
-    """
-    Tests geographic fields
-    """
-
-    def test_latitude(self):  # type: () -> None
-        schema = Latitude()
-        self.assertEqual(
-            schema.errors(89) or [],
-            [],
-        )
-        self.assertEqual(
-            schema.errors(-1.3412) or [],
-            [],
-        )
-        self.assertEqual(
-            schema.errors(180),
-            [Error('Value not <= 90')],
-        )
-        self.assertEqual(
-            schema.errors(-91),
-            [Error('Value not >= -90')],
-        )
-
-    def test_longitude(self):  # type: () -> None
-        schema = Longitude()
-        self.assertEqual(
-            schema.errors(129.1) or [],
-            [],
-        )
-        self.assertEqual(
-            schema.errors(186) or [],
-            [Error('Value not <= 180')],
-        )
-        self.assertEqual(
-            schema.errors(-181.3412) or [],
-            [Error('Value not >= -180')],
-        )
-
-    def test_limited_longitude(self):  # type: () -> None
-        schema = Longitude(lte=-50)
-        self.assertEqual(
-            schema.errors(-51.2) or [],
-            [],
-        )
-        self.assertEqual(
-            schema.errors(-49.32) or [],
-            [Error('Value not <= -50')],
-        )
+@pytest.fixture(scope='module')
+def latitude():  # type: () -> Latitude
+    return Latitude()
+
+
+@pytest.fixture(scope='module')
+def longitude():  # type: () -> Longitude
+    return Longitude()
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    (89, []),
+    (-1.3412, []),
+    (180, [Error('Value not <= 90')]),
+    (-91, [Error('Value not >= -90')]),
+))
+def test_latitude(latitude, value, expected_errors):  # type: (Latitude, float, list) -> None
+    assert (latitude.errors(value) or []) == expected_errors
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    (129.1, []),
+    (186, [Error('Value not <= 180')]),
+    (-181.3412, [Error('Value not >= -180')]),
+))
+def test_longitude(longitude, value, expected_errors):  # type: (Longitude, float, list) -> None
+    assert (longitude.errors(value) or []) == expected_errors
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    (-51.2, []),
+    (-49.32, [Error('Value not <= -50')]),
+))
+def test_limited_longitude(value, expected_errors):  # type: (float, list) -> None
+    assert (Longitude(lte=-50).errors(value) or []) == expected_errors
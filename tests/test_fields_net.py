@@ -3,7 +3,7 @@ from __future__ import (
     unicode_literals,
 )
 
-import unittest
+import pytest
 
 from conformity.fields import (
     IPAddress,
@@ -13,88 +13,55 @@ from conformity.fields import (
 from conformity.types import Error
 
 
-class NetFieldTests(unittest.TestCase):
-    """
-    Tests net fields
-    """
+@pytest.fixture(scope='module')
+def ipv4address():  # type: () -> IPv4Address
+    return IPv4Address()
 
-    def test_ipv4address(self):  # type: () -> None
-        schema = IPv4Address()
-        self.assertEqual(
-            schema.errors('127.0.0.1'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('127.300.0.1'),
-            [Error('Not a valid IPv4 address')],
-        )
-        self.assertEqual(
-            schema.errors('127.0.0'),
-            [Error('Not a valid IPv4 address')],
-        )
-        self.assertEqual(
-            schema.errors('a2.12.55.3'),
-            [Error('Not a valid IPv4 address')],
-        )
 
-    def test_ipv6address(self):  # type: () -> None
-        schema = IPv6Address()
-        self.assertEqual(
-            schema.errors('::2'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('abdf::4'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('34de:e23d::233e:32'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('::ffff:222.1.41.90'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('1232:d4af:6023:1afc:cfed:0239d:0934:0923d'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('1232:d4af:6023:1afc:cfed:0239d:0934:0923d:3421'),
-            [Error('Not a valid IPv6 address (too many colons)')],
-        )
-        self.assertEqual(
-            schema.errors('1:::42'),
-            [Error('Not a valid IPv6 address (shortener not bounded)')],
-        )
-        self.assertEqual(
-            schema.errors('1351:z::3'),
-            [Error('Not a valid IPv6 address (invalid hextet)')],
-        )
-        self.assertEqual(
-            schema.errors('dead:beef::3422:23::1'),
-            [Error('Not a valid IPv6 address (multiple shorteners)')],
-        )
-        self.assertEqual(
-            schema.errors('dead:beef::127.0.0.1:0'),
-            [Error('Not a valid IPv6 address (v4 section not at end)')],
-        )
-        self.assertEqual(
-            schema.errors('dead:beef::127.0.0.300'),
-            [Error('Not a valid IPv6 address (v4 section not valid address)')],
-        )
+@pytest.fixture(scope='module')
+def ipv6address():  # type: () -> IPv6Address
+    return IPv6Address()
 
-    def test_ipaddress(self):  # type: () -> None
-        schema = IPAddress()
-        self.assertEqual(
-            schema.errors('127.34.22.11'),
-            [],
-        )
-        self.assertEqual(
-            schema.errors('1232:d4af:6023:1afc:cfed:0239d:0934:0923d'),
-            [],
-        )
-        self.assertEqual(
-            len(schema.errors('I LOVE FISH')),
-            2,
-        )
+
+@pytest.fixture(scope='module')
+def ipaddress():  # type: () -> IPAddress
+    return IPAddress()
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    ('127.0.0.1', []),
+    ('127.300.0.1', [Error('Not a valid IPv4 address')]),
+    ('127.0.0', [Error('Not a valid IPv4 address')]),
+    ('a2.12.55.3', [Error('Not a valid IPv4 address')]),
+))
+def test_ipv4address(ipv4address, value, expected_errors):  # type: (IPv4Address, str, list) -> None
+    assert ipv4address.errors(value) == expected_errors
+
+
+@pytest.mark.parametrize(('value', 'expected_errors'), (
+    ('::2', []),
+    ('abdf::4', []),
+    ('34de:e23d::233e:32', []),
+    ('::ffff:222.1.41.90', []),
+    ('1232:d4af:6023:1afc:cfed:0239d:0934:0923d', []),
+    (
+        '1232:d4af:6023:1afc:cfed:0239d:0934:0923d:3421',
+        [Error('Not a valid IPv6 address (too many colons)')],
+    ),
+    ('1:::42', [Error('Not a valid IPv6 address (shortener not bounded)')]),
+    ('1351:z::3', [Error('Not a valid IPv6 address (invalid hextet)')]),
+    ('dead:beef::3422:23::1', [Error('Not a valid IPv6 address (multiple shorteners)')]),
+    ('dead:beef::127.0.0.1:0', [Error('Not a valid IPv6 address (v4 section not at end)')]),
+    ('dead:beef::127.0.0.300', [Error('Not a valid IPv6 address (v4 section not valid address)')]),
+))
+def test_ipv6address(ipv6address, value, expected_errors):  # type: (IPv6Address, str, list) -> None
+    assert ipv6address.errors(value) == expected_errors
+
+
+@pytest.mark.parametrize(('value', 'expected_error_count'), (
+    ('127.34.22.11', 0),
+    ('1232:d4af:6023:1afc:cfed:0239d:0934:0923d', 0),
+    ('I LOVE FISH', 2),
+))
+def test_ipaddress(ipaddress, value, expected_error_count):  # type: (IPAddress, str, int) -> None
+    assert len(ipaddress.errors(value)) == expected_error_count